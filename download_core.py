@@ -5,20 +5,48 @@ LibRetro Core 下载工具
 从 https://buildbot.libretro.com/nightly/ 下载预编译的 libretro 核心
 支持多平台和多核心选择
 """
+from __future__ import annotations
+
 import os
 import sys
 import platform
-import argparse
-import urllib.request
-import zipfile
-import gzip
+import json
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import TYPE_CHECKING
+
+# 仅在下载/解压/命令行路径用到的模块（http.client、zipfile、argparse 等）
+# 在函数内部按需导入，让 `--list` 和作为库导入时启动更快
+if TYPE_CHECKING:
+    import http.client
 
 
 # LibRetro 官方构建服务器
 BUILDBOT_URL = "https://buildbot.libretro.com/nightly"
 
+# 下载参数
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+HTTP_TIMEOUT = 30
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 0.05  # 进度最多每秒刷新 20 次
+MAX_PARALLEL_DOWNLOADS = 4
+
+# 记录 ETag / Last-Modified 的缓存文件（位于输出目录）
+CACHE_FILENAME = ".core_cache.json"
+
+# 按 (scheme, host) 缓存的 HTTP 连接，复用 TCP/TLS 会话
+# 连接不能跨线程共享，因此每个下载线程各自持有一份
+_local = threading.local()
+
+# 保护缓存文件的读-改-写
+_CACHE_LOCK = threading.Lock()
+
+# 串行化输出，并行下载时各行不会交错
+_PRINT_LOCK = threading.Lock()
+
 # 支持的核心列表
 SUPPORTED_CORES = {
     "arduous": "Arduous (official Arduboy emulator)",
@@ -44,8 +72,47 @@ PLATFORM_MAP = {
     }
 }
 
+# (系统, 架构) -> 构建目录；未列出的架构使用 PLATFORM_MAP 中该系统的默认构建
+_ARCH_BUILDS = {
+    ("Darwin", "arm64"): "apple/osx/arm64",      # Apple Silicon
+    ("Darwin", "aarch64"): "apple/osx/arm64",
+    ("Linux", "armv7l"): "linux/armv7-neon-hf",  # Raspberry Pi 32-bit
+    ("Linux", "armhf"): "linux/armv7-neon-hf",
+    ("Linux", "aarch64"): "linux/aarch64",       # Raspberry Pi 64-bit or other ARM64
+    ("Linux", "arm64"): "linux/aarch64",
+}
+
+# 预先展开的平台查找表，detect_platform 只做一次字典查找
+_PLATFORM_TABLE = {
+    (system, machine): {**PLATFORM_MAP[system], "name": name}
+    for (system, machine), name in _ARCH_BUILDS.items()
+}
+
+
+def _log(message: str = "") -> None:
+    """
+    线程安全地输出一行（整行一次写入）
+
+    Args:
+        message: 要输出的内容
+    """
+    with _PRINT_LOCK:
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+
+@lru_cache(maxsize=1)
+def _host_platform() -> tuple[str, str]:
+    """
+    当前主机的 (系统, 架构)，进程内不会变化，只探测一次
+
+    Returns:
+        (platform.system(), 小写的 platform.machine())
+    """
+    return platform.system(), platform.machine().lower()
+
 
-def detect_platform(verbose: bool = True) -> Dict[str, str]:
+def detect_platform(verbose: bool = True) -> dict[str, str]:
     """
     检测当前平台
 
@@ -55,41 +122,23 @@ def detect_platform(verbose: bool = True) -> Dict[str, str]:
     Returns:
         包含平台信息的字典
     """
-    system = platform.system()
-    machine = platform.machine().lower()
+    system, machine = _host_platform()
 
     if verbose:
-        print(f"Detected system: {system}, architecture: {machine}")
+        _log(f"Detected system: {system}, architecture: {machine}")
 
     if system not in PLATFORM_MAP:
         raise RuntimeError(f"Unsupported OS: {system}")
 
-    platform_info = PLATFORM_MAP[system].copy()
-
-    # 针对特定架构调整
-    if system == "Darwin" and machine in ["arm64", "aarch64"]:
-        # Apple Silicon
-        platform_info["name"] = platform_info["arch_alt"]
-        if verbose:
-            print(f"Using Apple Silicon build")
-    elif system == "Linux":
-        if machine in ["armv7l", "armhf"]:
-            # Raspberry Pi 32-bit
-            platform_info["name"] = platform_info["arch_alt"]
-            if verbose:
-                print(f"Using Raspberry Pi ARMv7 build")
-        elif machine in ["aarch64", "arm64"]:
-            # Raspberry Pi 64-bit or other ARM64
-            platform_info["name"] = "linux/aarch64"
-            if verbose:
-                print(f"Using ARM64 (aarch64) build")
-        elif verbose:
-            print(f"Using x86_64 build")
-
-    return platform_info
-
-
-def get_core_download_url(core_name: str, platform_info: Dict[str, str]) -> str:
+    platform_info = _PLATFORM_TABLE.get((system, machine)) or PLATFORM_MAP[system]
+
+    if verbose:
+        _log(f"Using {platform_info['name']} build")
+
+    return platform_info.copy()
+
+
+def get_core_download_url(core_name: str, platform_info: dict[str, str]) -> str:
     """
     构建 core 下载 URL
 
@@ -110,7 +159,183 @@ def get_core_download_url(core_name: str, platform_info: Dict[str, str]) -> str:
     return url
 
 
-def download_file(url: str, dest_path: Path, show_progress: bool = True) -> bool:
+def _get_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """
+    获取（或创建）指定主机的持久连接
+
+    Args:
+        scheme: URL 协议 (http/https)
+        netloc: 主机名（可带端口）
+
+    Returns:
+        可复用的 HTTP(S) 连接
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    key = (scheme, netloc)
+    conn = connections.get(key)
+    if conn is None:
+        import http.client
+
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(netloc, timeout=HTTP_TIMEOUT)
+        connections[key] = conn
+    return conn
+
+
+def _http_request(method: str, url: str, headers: dict[str, str] | None = None) -> http.client.HTTPResponse:
+    """
+    发送 HTTP 请求，复用连接并跟随重定向
+
+    Args:
+        method: 请求方法 (GET/HEAD)
+        url: 请求 URL
+        headers: 额外的请求头
+
+    Returns:
+        状态为 200 或 304 的响应对象（调用方负责读完 body）
+    """
+    import http.client
+    import urllib.parse
+
+    request_headers = {"User-Agent": "pyarduboy-runner"}
+    if headers:
+        request_headers.update(headers)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn = _get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request(method, path, headers=request_headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # 服务器可能已关闭空闲连接，重连一次
+            conn.close()
+            conn.request(method, path, headers=request_headers)
+            response = conn.getresponse()
+
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader("Location")
+            response.read()  # 读完 body 才能复用连接
+            if not location:
+                raise RuntimeError(f"Redirect without Location header: {url}")
+            url = urllib.parse.urljoin(url, location)
+            continue
+
+        if response.status not in (200, 304):
+            response.read()
+            raise RuntimeError(f"HTTP {response.status} {response.reason}: {url}")
+
+        return response
+
+    raise RuntimeError(f"Too many redirects: {url}")
+
+
+def _load_cache(output_dir: Path) -> dict[str, dict[str, str]]:
+    """
+    读取下载缓存（URL -> ETag / Last-Modified / 核心路径）
+
+    Args:
+        output_dir: 输出目录
+
+    Returns:
+        缓存字典，文件不存在或损坏时返回空字典
+    """
+    try:
+        with open(output_dir / CACHE_FILENAME, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_cache(output_dir: Path, url: str, entry: dict[str, str]) -> None:
+    """
+    更新下载缓存中的一条记录
+
+    重新读取缓存文件后再写回，避免并行下载时互相覆盖
+
+    Args:
+        output_dir: 输出目录
+        url: 下载 URL
+        entry: 该 URL 的缓存记录
+    """
+    with _CACHE_LOCK:
+        cache = _load_cache(output_dir)
+        cache[url] = entry
+        _save_cache(output_dir, cache)
+
+
+def _save_cache(output_dir: Path, cache: dict[str, dict[str, str]]) -> None:
+    """
+    写入下载缓存
+
+    Args:
+        output_dir: 输出目录
+        cache: 缓存字典
+    """
+    try:
+        with open(output_dir / CACHE_FILENAME, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        _log(f"Warning: could not write download cache: {e}")
+
+
+def is_not_modified(url: str, cache_entry: dict[str, str]) -> bool:
+    """
+    使用条件请求检查远端文件是否未变化
+
+    Args:
+        url: 下载 URL
+        cache_entry: 上次下载时记录的 ETag / Last-Modified
+
+    Returns:
+        服务器返回 304 (或 ETag 一致) 时返回 True
+    """
+    headers = {}
+    if cache_entry.get("etag"):
+        headers["If-None-Match"] = cache_entry["etag"]
+    if cache_entry.get("last_modified"):
+        headers["If-Modified-Since"] = cache_entry["last_modified"]
+    if not headers:
+        return False
+
+    try:
+        response = _http_request("HEAD", url, headers)
+        response.read()
+    except Exception as e:
+        _log(f"Warning: conditional request failed: {e}")
+        return False
+
+    if response.status == 304:
+        return True
+
+    etag = response.getheader("ETag")
+    return bool(etag) and etag == cache_entry.get("etag")
+
+
+def _advise_sequential(fd: int) -> None:
+    """
+    提示内核按顺序访问该文件，增大预读窗口（不支持的平台上忽略）
+
+    Args:
+        fd: 文件描述符
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+
+
+def download_file(url: str, dest_path: Path, show_progress: bool = True,
+                  cache_entry: dict[str, str] | None = None,
+                  cancel_event: threading.Event | None = None) -> bool:
     """
     下载文件
 
@@ -118,37 +343,116 @@ def download_file(url: str, dest_path: Path, show_progress: bool = True) -> bool
         url: 下载 URL
         dest_path: 目标路径
         show_progress: 是否显示进度
+        cache_entry: 若提供，写入响应的 ETag / Last-Modified
+        cancel_event: 若提供，被设置后中止下载（并行下载时用于响应 Ctrl+C）
 
     Returns:
         下载成功返回 True
     """
+    # 先写入同目录下的临时文件，完成后原子替换，中断时不会留下损坏的压缩包
+    part_path = dest_path.with_name(dest_path.name + ".part")
+
     try:
-        print(f"Downloading from: {url}")
+        _log(f"Downloading from: {url}")
 
         # 创建目标目录
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 下载文件
-        def reporthook(blocknum, blocksize, totalsize):
-            if show_progress and totalsize > 0:
-                percent = min(blocknum * blocksize / totalsize * 100, 100)
-                sys.stdout.write(f"\rProgress: {percent:.1f}%")
-                sys.stdout.flush()
-
-        urllib.request.urlretrieve(url, dest_path, reporthook if show_progress else None)
+        # 流式下载文件
+        response = _http_request("GET", url)
+        total = int(response.getheader("Content-Length") or 0)
+        received = 0
+        show_progress = show_progress and total > 0
+        next_print = 0.0
+
+        with open(part_path, 'wb') as target:
+            _advise_sequential(target.fileno())
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RuntimeError("Download cancelled")
+
+                # read1 返回已到达的数据，慢速连接上也能及时检查取消标志
+                chunk = response.read1(CHUNK_SIZE)
+                if not chunk:
+                    break
+                target.write(chunk)
+                received += len(chunk)
+
+                # 限制刷新频率，避免每个数据块都写一次终端
+                if show_progress:
+                    now = time.monotonic()
+                    if now >= next_print:
+                        next_print = now + PROGRESS_INTERVAL
+                        sys.stdout.write(f"\rProgress: {min(received / total * 100, 100):.1f}%")
+                        sys.stdout.flush()
 
         if show_progress:
-            print()  # 换行
+            _log(f"\rProgress: {min(received / total * 100, 100):.1f}%")
+
+        if total > 0 and received < total:
+            raise RuntimeError(f"Incomplete download: {received} of {total} bytes")
+
+        os.replace(part_path, dest_path)
 
-        print(f"Downloaded to: {dest_path}")
+        if cache_entry is not None:
+            cache_entry.clear()
+            for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+                value = response.getheader(header)
+                if value:
+                    cache_entry[key] = value
+
+        _log(f"Downloaded to: {dest_path}")
         return True
 
     except Exception as e:
-        print(f"Error downloading file: {e}")
+        _log(f"Error downloading file: {e}")
         return False
 
+    finally:
+        # 未完成替换（出错或 Ctrl+C 中断）时清理临时文件
+        if part_path.exists():
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
+
 
-def extract_core(archive_path: Path, output_dir: Path, core_name: str, platform_info: Dict[str, str]) -> Optional[Path]:
+def _core_matches(core_path: Path, cache_entry: dict[str, str]) -> bool:
+    """
+    校验本地核心是否与缓存记录的解压结果一致（大小 + CRC32），无需打开压缩包
+
+    Args:
+        core_path: 本地核心文件路径
+        cache_entry: 记录了 size / crc 的缓存条目
+
+    Returns:
+        文件存在且大小、CRC 都一致时返回 True
+    """
+    import zlib
+
+    if not cache_entry.get("size") or not cache_entry.get("crc"):
+        return False
+
+    try:
+        if str(core_path.stat().st_size) != cache_entry["size"]:
+            return False
+
+        crc = 0
+        with open(core_path, 'rb') as f:
+            _advise_sequential(f.fileno())
+            while True:
+                chunk = f.read(EXTRACT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                crc = zlib.crc32(chunk, crc)
+    except OSError:
+        return False
+
+    return f"{crc:08x}" == cache_entry["crc"]
+
+
+def extract_core(archive_path: Path, output_dir: Path, core_name: str, platform_info: dict[str, str],
+                 cache_entry: dict[str, str] | None = None) -> Path | None:
     """
     解压核心文件
 
@@ -157,10 +461,14 @@ def extract_core(archive_path: Path, output_dir: Path, core_name: str, platform_
         output_dir: 输出目录
         core_name: 核心名称
         platform_info: 平台信息
+        cache_entry: 若提供，读取上次解压的 CRC 并写入本次的 CRC 和解压后大小
 
     Returns:
         解压后的核心文件路径，失败返回 None
     """
+    import shutil
+    import zipfile
+
     try:
         ext_map = {
             "dylib.zip": "dylib",
@@ -172,19 +480,39 @@ def extract_core(archive_path: Path, output_dir: Path, core_name: str, platform_
         core_filename = f"{core_name}_libretro.{lib_ext}"
         output_path = output_dir / core_filename
 
-        print(f"Extracting {archive_path.name}...")
+        _log(f"Extracting {archive_path.name}...")
 
         # 解压 zip 文件
-        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            # 查找核心文件
-            for member in zip_ref.namelist():
-                if member.endswith(core_filename):
-                    # 提取文件
-                    with zip_ref.open(member) as source:
-                        with open(output_path, 'wb') as target:
-                            target.write(source.read())
+        with open(archive_path, 'rb') as archive:
+            _advise_sequential(archive.fileno())
+
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                # 查找核心文件：归档通常是平铺的，先直接按文件名查找
+                try:
+                    member = zip_ref.getinfo(core_filename)
+                except KeyError:
+                    member = next((info for info in zip_ref.infolist()
+                                   if info.filename.endswith(core_filename)), None)
+
+                if member is not None:
+                    crc = f"{member.CRC:08x}"
+
+                    # 本地核心与归档内容一致（大小 + CRC）时无需重新解压
+                    if (cache_entry is not None and cache_entry.get("crc") == crc
+                            and _core_matches(output_path, {"crc": crc, "size": str(member.file_size)})):
+                        _log(f"Up-to-date: {output_path}")
+                        cache_entry["size"] = str(member.file_size)
+                        return output_path
 
-                    print(f"Extracted to: {output_path}")
+                    if cache_entry is not None:
+                        cache_entry["crc"] = crc
+                        cache_entry["size"] = str(member.file_size)
+
+                    # 分块流式提取，避免把整个核心读入内存
+                    with zip_ref.open(member) as source, open(output_path, 'wb') as target:
+                        shutil.copyfileobj(source, target, EXTRACT_CHUNK_SIZE)
+
+                    _log(f"Extracted to: {output_path}")
 
                     # 设置可执行权限 (Unix-like 系统)
                     if platform.system() != "Windows":
@@ -192,15 +520,36 @@ def extract_core(archive_path: Path, output_dir: Path, core_name: str, platform_
 
                     return output_path
 
-        print(f"Error: Core file not found in archive")
+        _log(f"Error: Core file not found in archive")
         return None
 
     except Exception as e:
-        print(f"Error extracting archive: {e}")
+        _log(f"Error extracting archive: {e}")
         return None
 
 
-def download_core(core_name: str, output_dir: Optional[Path] = None, platform_override: Optional[str] = None) -> Optional[Path]:
+def _resolve_platform(platform_override: str | None = None) -> dict[str, str] | None:
+    """
+    确定下载平台
+
+    Args:
+        platform_override: 平台覆盖（用于交叉下载）
+
+    Returns:
+        平台信息字典，平台未知时返回 None
+    """
+    if platform_override:
+        # 手动指定平台
+        if platform_override not in PLATFORM_MAP:
+            _log(f"Error: Unknown platform '{platform_override}'")
+            return None
+        return PLATFORM_MAP[platform_override]
+
+    return detect_platform()
+
+
+def download_core(core_name: str, output_dir: Path | None = None, platform_override: str | None = None,
+                  show_progress: bool = True) -> Path | None:
     """
     下载并解压 libretro 核心
 
@@ -208,57 +557,149 @@ def download_core(core_name: str, output_dir: Optional[Path] = None, platform_ov
         core_name: 核心名称 (arduous/ardens)
         output_dir: 输出目录（默认为 ./core）
         platform_override: 平台覆盖（用于交叉下载）
+        show_progress: 是否显示下载进度
 
     Returns:
         核心文件路径，失败返回 None
     """
     if core_name not in SUPPORTED_CORES:
-        print(f"Error: Unknown core '{core_name}'")
-        print(f"Supported cores: {', '.join(SUPPORTED_CORES.keys())}")
+        _log(f"Error: Unknown core '{core_name}'")
+        _log(f"Supported cores: {', '.join(SUPPORTED_CORES.keys())}")
         return None
 
+    # 检测平台
+    platform_info = _resolve_platform(platform_override)
+    if platform_info is None:
+        return None
+
+    return _install_core(core_name, output_dir, platform_info, show_progress)
+
+
+def _install_core(core_name: str, output_dir: Path | None, platform_info: dict[str, str],
+                  show_progress: bool = True, cancel_event: threading.Event | None = None) -> Path | None:
+    """
+    为已确定的平台下载并解压核心（download_core / download_cores 的共同实现）
+
+    Args:
+        core_name: 核心名称 (arduous/ardens)
+        output_dir: 输出目录（默认为 ./core）
+        platform_info: 平台信息
+        show_progress: 是否显示下载进度
+        cancel_event: 若提供，被设置后中止下载和解压
+
+    Returns:
+        核心文件路径，失败返回 None
+    """
     # 设置输出目录
     if output_dir is None:
         output_dir = Path(__file__).parent / "core"
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # 检测平台
-    if platform_override:
-        # 手动指定平台
-        if platform_override not in PLATFORM_MAP:
-            print(f"Error: Unknown platform '{platform_override}'")
-            return None
-        platform_info = PLATFORM_MAP[platform_override]
-    else:
-        platform_info = detect_platform()
-
-    print(f"Platform: {platform_info['name']}")
-    print(f"Core: {core_name} - {SUPPORTED_CORES[core_name]}")
+    _log(f"Platform: {platform_info['name']}")
+    _log(f"Core: {core_name} - {SUPPORTED_CORES[core_name]}")
 
     # 构建下载 URL
     download_url = get_core_download_url(core_name, platform_info)
 
+    # 远端未变化且本地核心仍是上次解压的文件（大小 + CRC 一致）时，跳过下载和解压
+    # （build_*_core.sh 会用本地编译的同名核心覆盖，此时重新下载）
+    cached = _load_cache(output_dir).get(download_url, {})
+    cached_core = Path(cached["core_path"]) if cached.get("core_path") else None
+
+    if cached_core and _core_matches(cached_core, cached) and is_not_modified(download_url, cached):
+        _log(f"Core is up to date (not modified on server): {cached_core}")
+        return cached_core
+
     # 下载文件
     archive_path = output_dir / f"{core_name}_libretro.{platform_info['ext']}"
 
-    if not download_file(download_url, archive_path):
+    entry: dict[str, str] = {}
+    if not download_file(download_url, archive_path, show_progress, cache_entry=entry,
+                         cancel_event=cancel_event):
         return None
 
+    # 下载完成后才收到取消请求：不再解压，删除压缩包
+    if cancel_event is not None and cancel_event.is_set():
+        archive_path.unlink()
+        return None
+
+    # 保留上次解压的 CRC，供 extract_core 判断是否需要重新解压
+    if cached.get("crc"):
+        entry["crc"] = cached["crc"]
+
     # 解压文件
-    core_path = extract_core(archive_path, output_dir, core_name, platform_info)
+    core_path = extract_core(archive_path, output_dir, core_name, platform_info, entry)
+
+    if core_path and entry:
+        entry["core_path"] = str(core_path)
+        _update_cache(output_dir, download_url, entry)
 
     # 清理压缩包
     if core_path and archive_path.exists():
-        print(f"Cleaning up: {archive_path}")
+        _log(f"Cleaning up: {archive_path}")
         archive_path.unlink()
 
     if core_path:
-        print(f"\nSuccess! Core installed at: {core_path}")
+        _log(f"\nSuccess! Core installed at: {core_path}")
 
     return core_path
 
 
+def download_cores(core_names: list[str], output_dir: Path | None = None,
+                   platform_override: str | None = None) -> dict[str, Path | None]:
+    """
+    并行下载多个 libretro 核心
+
+    每个核心在独立线程中下载，总耗时约等于最慢的一个而非全部之和
+
+    Args:
+        core_names: 核心名称列表
+        output_dir: 输出目录（默认为 ./core）
+        platform_override: 平台覆盖（用于交叉下载）
+
+    Returns:
+        核心名称 -> 核心文件路径（失败为 None）
+    """
+    names = list(dict.fromkeys(core_names))  # 去重并保持顺序
+    if len(names) == 1:
+        return {names[0]: download_core(names[0], output_dir, platform_override)}
+
+    results: dict[str, Path | None] = {}
+    for name in names:
+        if name not in SUPPORTED_CORES:
+            _log(f"Error: Unknown core '{name}'")
+            results[name] = None
+
+    # 平台只检测一次，各线程共用
+    platform_info = _resolve_platform(platform_override)
+    if platform_info is None:
+        return {name: None for name in names}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    valid = [name for name in names if name not in results]
+    workers = min(MAX_PARALLEL_DOWNLOADS, len(valid)) or 1
+    cancel_event = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            name: executor.submit(_install_core, name, output_dir, platform_info, False, cancel_event)
+            for name in valid
+        }
+        for name, future in futures.items():
+            results[name] = future.result()
+    except KeyboardInterrupt:
+        # Ctrl+C：通知所有下载线程中止（各自清理 .part 文件），不等它们下载完
+        cancel_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+    return {name: results[name] for name in names}
+
+
 def list_cores():
     """列出支持的核心"""
     print("Supported Arduboy cores:")
@@ -268,6 +709,8 @@ def list_cores():
 
 def main():
     """主函数"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Download libretro cores from official buildbot",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -279,6 +722,9 @@ Examples:
   # 下载 ardens core
   python download_core.py ardens
 
+  # 同时下载多个核心（并行）
+  python download_core.py arduous ardens
+
   # 下载到指定目录
   python download_core.py arduous --output /path/to/cores
 
@@ -289,9 +735,9 @@ Examples:
 
     parser.add_argument(
         "core",
-        nargs="?",
-        choices=list(SUPPORTED_CORES.keys()),
-        help="Core to download"
+        nargs="*",
+        metavar="core",
+        help=f"Core(s) to download ({', '.join(SUPPORTED_CORES.keys())})"
     )
 
     parser.add_argument(
@@ -324,10 +770,14 @@ Examples:
         parser.print_help()
         return 1
 
+    unknown = [name for name in args.core if name not in SUPPORTED_CORES]
+    if unknown:
+        parser.error(f"unknown core(s): {', '.join(unknown)} (choose from {', '.join(SUPPORTED_CORES.keys())})")
+
     # 下载核心
-    core_path = download_core(args.core, args.output, args.platform)
+    results = download_cores(args.core, args.output, args.platform)
 
-    return 0 if core_path else 1
+    return 0 if all(results.values()) else 1
 
 
 if __name__ == "__main__":
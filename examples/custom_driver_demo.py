@@ -54,17 +54,22 @@ class ImageSaveDriver(VideoDriver):
         """渲染一帧（保存为图像）"""
         self.frame_count += 1
 
-        # 只保存指定间隔的帧
-        if self.frame_count % self.save_interval == 0:
-            # 转换为 PIL Image
-            img = Image.fromarray(frame_buffer, 'RGB')
-
-            # 保存文件
-            filename = f"frame_{self.frame_count:06d}.png"
-            filepath = os.path.join(self.output_dir, filename)
-            img.save(filepath)
-
-            print(f"Saved: {filename}")
+        # 只保存指定间隔的帧，其余帧不触碰 frame_buffer
+        if self.frame_count % self.save_interval != 0:
+            return
+
+        # 连续的 uint8 缓冲区可直接零拷贝转换为 PIL Image
+        if frame_buffer.dtype != np.uint8 or not frame_buffer.flags['C_CONTIGUOUS']:
+            frame_buffer = np.ascontiguousarray(frame_buffer, dtype=np.uint8)
+        height, width = frame_buffer.shape[:2]
+        img = Image.frombuffer('RGB', (width, height), frame_buffer, 'raw', 'RGB', 0, 1)
+
+        # 保存文件（低压缩级别，PNG 编码更快）
+        filename = f"frame_{self.frame_count:06d}.png"
+        filepath = os.path.join(self.output_dir, filename)
+        img.save(filepath, compress_level=1)
+
+        print(f"Saved: {filename}")
 
     def close(self) -> None:
         """关闭驱动"""
@@ -2,62 +2,153 @@
 """
 列出所有输入设备的详细信息
 帮助选择正确的键盘设备
+
+扫描结果缓存在 ~/.cache/pyarduboy/devices.json，设备列表未变化时
+不再逐个打开设备；使用 --rescan 强制重新扫描
 """
+import hashlib
+import json
+import os
+import sys
+
 from evdev import InputDevice, ecodes, list_devices
 
 
+# 用于判断设备类型的按键集合
+_LETTERS = frozenset([ecodes.KEY_A, ecodes.KEY_W, ecodes.KEY_J, ecodes.KEY_K])
+_ARROWS = frozenset([ecodes.KEY_UP, ecodes.KEY_DOWN, ecodes.KEY_LEFT, ecodes.KEY_RIGHT])
+_NUMBERS = frozenset([ecodes.KEY_1, ecodes.KEY_2, ecodes.KEY_3])
+_MOUSE = frozenset([ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE])
+
+# 设备扫描缓存
+_PROC_DEVICES = "/proc/bus/input/devices"
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pyarduboy", "devices.json")
+
+
+def _devices_fingerprint(paths):
+    """
+    返回输入设备列表的摘要；无法读取时返回 None
+
+    除内核设备列表外还包含当前用户可访问的设备节点（list_devices() 会跳过
+    无读写权限的节点），设备插拔或权限变化（如加入 input 组）后摘要都会变化
+    """
+    try:
+        with open(_PROC_DEVICES, "rb") as f:
+            digest = hashlib.sha1(f.read())
+    except OSError:
+        return None
+
+    digest.update("\n".join(sorted(paths)).encode())
+    return digest.hexdigest()
+
+
+def _probe_device(device):
+    """打开设备读取能力，生成可缓存的摘要"""
+    info = {
+        "path": device.path,
+        "name": device.name,
+        "phys": device.phys,
+        "uniq": device.uniq,
+        "capabilities": [],
+    }
+
+    for ev_type, codes in device.capabilities().items():
+        info["capabilities"].append({
+            "type": ecodes.EV.get(ev_type, f"UNKNOWN({ev_type})"),
+            "count": len(codes),
+        })
+
+        if ev_type == ecodes.EV_KEY:
+            # 检查按键类型（集合求交代替逐个列表查找）
+            code_set = frozenset(codes)
+            info["has_letters"] = not _LETTERS.isdisjoint(code_set)
+            info["has_arrows"] = not _ARROWS.isdisjoint(code_set)
+            info["has_numbers"] = not _NUMBERS.isdisjoint(code_set)
+            info["has_mouse"] = not _MOUSE.isdisjoint(code_set)
+
+    return info
+
+
+def _scan_input_devices(force=False):
+    """
+    扫描所有输入设备
+
+    Args:
+        force: 忽略缓存，重新打开每个设备
+
+    Returns:
+        设备摘要列表
+    """
+    paths = list_devices()
+    fingerprint = _devices_fingerprint(paths)
+
+    if not force and fingerprint is not None:
+        try:
+            with open(_CACHE_PATH, "r") as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return cached["devices"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    devices = []
+    for path in paths:
+        device = InputDevice(path)
+        try:
+            devices.append(_probe_device(device))
+        finally:
+            device.close()
+
+    # 空结果不缓存：通常是权限问题，下次运行应重新检查
+    if fingerprint is not None and devices:
+        try:
+            os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+            with open(_CACHE_PATH, "w") as f:
+                json.dump({"fingerprint": fingerprint, "devices": devices}, f)
+        except OSError:
+            pass
+
+    return devices
+
+
 def main():
     print("=" * 70)
     print("All Input Devices")
     print("=" * 70)
     print()
 
-    devices = [InputDevice(path) for path in list_devices()]
+    devices = _scan_input_devices(force="--rescan" in sys.argv[1:])
 
     if not devices:
         print("No input devices found!")
         return 1
 
     for i, device in enumerate(devices):
-        print(f"[{i}] {device.path}")
-        print(f"    Name: {device.name}")
-        print(f"    Physical: {device.phys}")
-        print(f"    Uniq: {device.uniq}")
+        print(f"[{i}] {device['path']}")
+        print(f"    Name: {device['name']}")
+        print(f"    Physical: {device['phys']}")
+        print(f"    Uniq: {device['uniq']}")
 
         # 显示能力
-        capabilities = device.capabilities()
         print(f"    Capabilities:")
 
-        for ev_type, codes in capabilities.items():
-            type_name = ecodes.EV.get(ev_type, f"UNKNOWN({ev_type})")
-            print(f"      - {type_name}: ", end="")
-
-            if ev_type == ecodes.EV_KEY:
-                # 检查按键类型
-                has_letters = any(code in codes for code in [
-                    ecodes.KEY_A, ecodes.KEY_W, ecodes.KEY_J, ecodes.KEY_K
-                ])
-                has_arrows = any(code in codes for code in [
-                    ecodes.KEY_UP, ecodes.KEY_DOWN, ecodes.KEY_LEFT, ecodes.KEY_RIGHT
-                ])
-                has_numbers = any(code in codes for code in [
-                    ecodes.KEY_1, ecodes.KEY_2, ecodes.KEY_3
-                ])
-                has_mouse = any(code in codes for code in [
-                    ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE
-                ])
-
-                features = []
-                if has_letters:
-                    features.append("letters")
-                if has_arrows:
-                    features.append("arrows")
-                if has_numbers:
-                    features.append("numbers")
-                if has_mouse:
-                    features.append("mouse_buttons")
-
-                print(f"{len(codes)} keys [{', '.join(features)}]")
+        for capability in device["capabilities"]:
+            print(f"      - {capability['type']}: ", end="")
+
+            if capability["type"] == "EV_KEY":
+                has_letters = device["has_letters"]
+                has_arrows = device["has_arrows"]
+                has_numbers = device["has_numbers"]
+                has_mouse = device["has_mouse"]
+
+                features = [name for name, present in (
+                    ("letters", has_letters),
+                    ("arrows", has_arrows),
+                    ("numbers", has_numbers),
+                    ("mouse_buttons", has_mouse),
+                ) if present]
+
+                print(f"{capability['count']} keys [{', '.join(features)}]")
 
                 # 判断设备类型
                 if has_letters and has_numbers:
@@ -67,7 +158,7 @@ def main():
                 elif has_mouse:
                     print(f"      → This is a mouse")
             else:
-                print(f"{len(codes)} codes")
+                print(f"{capability['count']} codes")
 
         print()
 
@@ -81,5 +172,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
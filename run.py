@@ -19,6 +19,8 @@ Arduboy 模拟器 - 使用 PyArduboy 架构
 import sys
 import os
 import argparse
+import ctypes
+import ctypes.util
 
 # 添加当前目录到 Python 路径
 sys.path.insert(0, os.path.dirname(__file__))
@@ -136,6 +138,46 @@ def setup_alsa_audio(arduboy):
         return False
 
 
+def enable_realtime(priority=10):
+    """
+    提升当前线程为实时调度并锁定进程内存，减少内核抢占和缺页带来的帧抖动
+
+    需要 root 或 CAP_SYS_NICE/CAP_IPC_LOCK 权限，例如:
+      sudo setcap 'cap_sys_nice,cap_ipc_lock=eip' $(readlink -f $(which python3))
+    之后由该线程创建的驱动线程会继承调度策略。失败时仅打印提示，继续以普通优先级运行。
+    """
+    # SCHED_FIFO / mlockall 仅在 Linux 上可用（Windows/macOS 桌面环境直接跳过）
+    if not sys.platform.startswith("linux") or not hasattr(os, "sched_setscheduler"):
+        print("⚠ Realtime mode is only supported on Linux, ignoring --realtime")
+        return False
+
+    enabled = True
+
+    # SCHED_FIFO: 只会被更高优先级的实时任务抢占
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        print(f"✓ Realtime scheduling enabled (SCHED_FIFO, priority {priority})")
+    except (AttributeError, OSError) as e:
+        print(f"⚠ Could not enable realtime scheduling: {e}")
+        enabled = False
+
+    # mlockall(MCL_CURRENT | MCL_FUTURE): 锁定当前及以后分配的内存，避免换页
+    try:
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("C library not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if libc.mlockall(1 | 2) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        print("✓ Process memory locked (mlockall)")
+    except (AttributeError, OSError) as e:
+        print(f"⚠ Could not lock process memory: {e}")
+        enabled = False
+
+    return enabled
+
+
 def main():
     """主函数"""
     # 解析命令行参数
@@ -159,6 +201,9 @@ Examples:
 
   # 查看可用的颜色主题
   python3 run.py game.hex -v pygame --color amber
+
+  # 实时调度 + 锁定内存，降低帧抖动（需要 sudo 或 CAP_SYS_NICE）
+  sudo python3 run.py game.hex --realtime
         """
     )
 
@@ -178,6 +223,8 @@ Examples:
                         help='灰度模式 Plane 刷新频率(Hz): 控制灰度层切换速度 (default: 180)')
     parser.add_argument('--core', type=str, default=None,
                         help='Libretro 核心名称 (如: ardens, gearboy, arduous) (default: 自动检测)')
+    parser.add_argument('--realtime', action='store_true',
+                        help='使用 SCHED_FIFO 实时调度并 mlockall 锁定内存，减少帧抖动 (需要 root 或 CAP_SYS_NICE)')
 
     args = parser.parse_args()
 
@@ -296,6 +343,10 @@ Examples:
     print("\nPress Ctrl+C to stop.")
     print("="*60 + "\n")
 
+    # 实时调度（在运行线程上设置，驱动创建的线程会继承）
+    if args.realtime:
+        enable_realtime()
+
     # 运行游戏
     try:
         arduboy.run()